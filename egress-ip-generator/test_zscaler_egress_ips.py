@@ -0,0 +1,168 @@
+"""
+test_zscaler_egress_ips.py
+
+Checks for the CIDR parsing/collapse helpers and the IP table lookup in
+zscaler_egress_ips.py. The collapse and parse helpers are compared against
+Python's ipaddress module on randomized inputs, and the streaming table
+parser is compared against the in-memory lookup on shifted layouts.
+
+Usage:
+    python3 -m pytest test_zscaler_egress_ips.py
+"""
+
+import io
+import ipaddress
+import json
+import random
+import socket
+
+import pytest
+
+import zscaler_egress_ips as z
+
+
+def _random_networks(rng, bits, count):
+    """Random networks clustered in a small range so they overlap and merge."""
+    cls = ipaddress.IPv4Network if bits == 32 else ipaddress.IPv6Network
+    base = rng.getrandbits(bits) & ~((1 << 10) - 1)
+    nets = []
+    for _ in range(count):
+        if rng.random() < 0.95:
+            prefix = rng.randint(bits - 10, bits)
+        else:
+            prefix = rng.randint(0, bits)
+        addr = (base + rng.getrandbits(10)) & ((1 << bits) - 1)
+        nets.append(cls((addr, prefix), strict=False))
+    return nets
+
+
+@pytest.mark.parametrize("bits", [32, 128])
+def test_collapse_blocks_matches_ipaddress(bits):
+    rng = random.Random(bits)
+    for _ in range(1500):
+        nets = _random_networks(rng, bits, rng.randint(0, 40))
+        expected = [(int(n.network_address), n.prefixlen) for n in ipaddress.collapse_addresses(nets)]
+        blocks = [(int(n.network_address), n.prefixlen) for n in nets]
+        assert z._collapse_blocks(blocks, bits) == expected
+
+
+def test_collapse_ipv4_kernel_matches_sweep(monkeypatch):
+    pytest.importorskip("numba")
+    monkeypatch.setattr(z, "NUMBA_MIN_BLOCKS", 0)
+    rng = random.Random(4)
+    for _ in range(200):
+        blocks = [(int(n.network_address), n.prefixlen) for n in _random_networks(rng, 32, rng.randint(1, 60))]
+        assert z._collapse_ipv4_blocks(blocks) == z._collapse_blocks(blocks, 32)
+
+    blocks = [(rng.getrandbits(32) & ~0xff, 24) for _ in range(15000)]
+    nets = [ipaddress.IPv4Network(block) for block in blocks]
+    expected = [(int(n.network_address), n.prefixlen) for n in ipaddress.collapse_addresses(nets)]
+    assert z._collapse_ipv4_blocks(blocks) == expected
+
+
+@pytest.mark.parametrize("text", [
+    "1.2.3.4", "1.2.3.4/24", "0.0.0.0/0", "10.0.0.0/255.0.0.0", "10.0.0.0/0.0.0.255",
+    "::1", "::/0", "2001:db8::1/64", "::ffff:1.2.3.4/120", "2400:7aa0::/32"
+])
+def test_parse_cidr_matches_ipaddress(text):
+    net = ipaddress.ip_network(text, strict=False)
+    addr, prefix, family = z._parse_cidr(text)
+    assert (addr, prefix) == (int(net.network_address), net.prefixlen)
+    assert family == (socket.AF_INET if net.version == 4 else socket.AF_INET6)
+    assert z._format_cidr(addr, prefix, family) == str(net)
+
+
+@pytest.mark.parametrize("text", [
+    "1.2.3.4/33", "1.2.3/24", "01.2.3.4", "2001:db8::/129", "garbage", "", "1.2.3.4/", "1.2.3.4/+8", "1.2.3.4/ 8"
+])
+def test_parse_cidr_rejects_invalid(text):
+    with pytest.raises(ValueError):
+        ipaddress.ip_network(text, strict=False)
+    with pytest.raises(ValueError):
+        z._parse_cidr(text)
+
+
+def test_parse_cidr_random_round_trip():
+    rng = random.Random(2)
+    for _ in range(5000):
+        bits = rng.choice([32, 128])
+        cls = ipaddress.IPv4Network if bits == 32 else ipaddress.IPv6Network
+        net = cls((rng.getrandbits(bits), rng.randint(0, bits)), strict=False)
+        text = f"{net.network_address + rng.getrandbits(4) if net.num_addresses > 16 else net.network_address}/{net.prefixlen}"
+        addr, prefix, family = z._parse_cidr(text)
+        assert (addr, prefix) == (int(net.network_address), net.prefixlen)
+        assert z._format_cidr(addr, prefix, family) == str(net)
+
+
+def test_summarize_ip_blocks():
+    entries = [
+        {"ip_address": "185.46.212.0/25", "ready": True},
+        {"ip_address": "185.46.212.128/25", "ready": True},
+        {"ip_address": "185.46.212.7", "ready": True},
+        {"ip_address": "147.161.174.0/23", "ready": False},
+        {"ip_address": "2400:7aa0::/33", "ready": True},
+        {"ip_address": "2400:7aa0:8000::/33", "ready": True},
+        {"ip_address": "not-an-ip", "ready": True},
+        {"ip_address": None, "ready": True},
+    ]
+    assert list(z.summarize_ip_blocks(entries)) == [
+        {"ip_address": "185.46.212.0/24"},
+        {"ip_address": "2400:7aa0::/32"},
+    ]
+
+
+IP_TABLE = {"body": {"json": {"rows": [
+    {"title": "header"},
+    {"cols": [{"data": [{"ip_address": "185.46.212.88", "region": "Americas", "location": "Dallas"}]}]},
+    {"cols": [{"data": [{"multivip": True, "data": [
+        {"ip_address": "147.161.174.0/23", "region": "EMEA", "location": "Frankfurt", "notes": [{"id": 3}]}
+    ]}]}]},
+]}}}
+OTHER_TABLE = {"body": {"json": {"rows": [{"title": "header"}, {"name": "x", "value": [1, {"a": 2}]}]}}}
+SCALAR_TABLE = {"body": {"json": {"rows": [{"title": "header"}, "scalar", 3]}}}
+
+
+def _document(table_index, extras=()):
+    items = [{"id": i, "body": {"json": {}}} for i in range(10)]
+    for index, item in extras:
+        items[index] = item
+    if table_index is not None:
+        items[table_index] = IP_TABLE
+    return {"data": items}
+
+
+@pytest.mark.parametrize("table_index, extras", [
+    (6, ()),
+    (0, ()),
+    (2, ()),
+    (9, ()),
+    (3, [(2, OTHER_TABLE)]),
+    (8, [(6, SCALAR_TABLE), (7, OTHER_TABLE)]),
+])
+def test_stream_table_rows_matches_find_table_rows(table_index, extras):
+    pytest.importorskip("ijson")
+    doc = _document(table_index, extras)
+    expected = IP_TABLE["body"]["json"]["rows"]
+    assert z._find_table_rows(doc["data"]) == expected
+    streamed = list(z._stream_table_rows(io.BytesIO(json.dumps(doc).encode("utf-8"))))
+    assert streamed == expected
+
+
+def test_table_lookup_raises_without_ip_table():
+    pytest.importorskip("ijson")
+    doc = _document(None, [(2, OTHER_TABLE), (6, SCALAR_TABLE)])
+    with pytest.raises(ValueError):
+        z._find_table_rows(doc["data"])
+    with pytest.raises(ValueError):
+        list(z._stream_table_rows(io.BytesIO(json.dumps(doc).encode("utf-8"))))
+
+
+def test_save_as_json_matches_single_dump(tmp_path):
+    data = [
+        {"ip_address": "185.46.212.88", "location": "São Paulo", "ready": True},
+        {"ip_address": "2400:7aa0::/32", "location": None, "ready": False},
+    ]
+    for entries in (data, []):
+        path = tmp_path / "out.json"
+        z.save_as_json(iter(entries), filename=str(path))
+        assert path.read_bytes() == json.dumps(entries, indent=2, ensure_ascii=False).encode("utf-8")
@@ -11,30 +11,417 @@ Description:
 
     - By default: outputs detailed IP info with metadata.
     - With --summarize: outputs consolidated CIDR blocks in simplified JSON.
+    - With --streaming: parses the response incrementally to reduce memory use.
 
 Usage:
     python3 zscaler_egress_ips.py
     python3 zscaler_egress_ips.py --summarize
+    python3 zscaler_egress_ips.py --streaming
     python3 zscaler_egress_ips.py --url <custom_url> --output <filename>
+    python3 zscaler_egress_ips.py --url <url_1> <url_2>
 """
 
 import requests
 import json
 import argparse
+import functools
 import ipaddress
+import itertools
+import os
+import socket
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Sequence
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    # orjson is optional; fall back to the standard library json module
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    # ijson is optional; only required for --streaming
+    ijson = None
 
 # Default Zscaler public egress IP endpoint
 DEFAULT_URL = "https://config.zscaler.com/api/getdata/zscaler.net/all/cenr?site=config.zscaler.com"
 
-def fetch_zscaler_egress_ips(url=DEFAULT_URL):
+# Note id marking an IP entry as not yet ready for use
+NOT_READY_NOTE_ID = 3
+
+# Minimum number of IPv4 blocks before the numba collapse kernel is used.
+# Importing numba and loading the cached kernel costs ~300 ms per process,
+# and converting the blocks to arrays eats most of the kernel's speedup, so
+# it only beats the pure Python sweep at around half a million blocks.
+NUMBA_MIN_BLOCKS = 500000
+
+# (numpy module, compiled kernel) once built on first large summary; False if
+# numba/numpy are not installed. Loaded lazily since importing numba is slow.
+_ipv4_kernel = None
+
+# Connections kept per host; also caps concurrent fetches of multiple URLs
+POOL_MAXSIZE = 10
+
+# (connect, read) timeouts in seconds for the API request
+REQUEST_TIMEOUT = (5, 30)
+
+
+def _build_session():
+    """
+    Build a shared HTTP session with connection pooling and retry/backoff
+    on transient failures (rate limiting and 5xx responses).
+
+    Returns:
+        requests.Session: Configured session.
+    """
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504]
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=POOL_MAXSIZE, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({"Accept-Encoding": "gzip, deflate"})
+    return session
+
+
+# Reused across calls so repeated fetches keep the connection alive
+_SESSION = _build_session()
+
+
+def _json_loads(raw):
+    """
+    Parse a JSON document from raw response bytes, using orjson if available.
+    Working from the bytes skips requests' charset detection and str decode
+    in resp.json(); orjson parses UTF-8 bytes directly.
+
+    Args:
+        raw (bytes): UTF-8 encoded JSON document.
+
+    Returns:
+        object: The decoded document.
+    """
+    if orjson is not None:
+        return orjson.loads(raw)
+    # The API always sends UTF-8, so skip json's encoding detection
+    return json.loads(raw.decode("utf-8"))
+
+
+def _json_dumps(data):
+    """
+    Serialize data to indented JSON bytes, using orjson if available.
+
+    Args:
+        data (object): JSON-serializable data.
+
+    Returns:
+        bytes: The encoded document.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # Match orjson, which writes non-ASCII text as raw UTF-8 rather than \u escapes
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def _is_table_row(row):
+    """
+    Check whether a table row has the shape of an IP table region row.
+
+    Args:
+        row (object): A row following the table's header row.
+
+    Returns:
+        bool: True if the row is a dict with a "cols" list.
+    """
+    return isinstance(row, dict) and isinstance(row.get("cols"), list)
+
+
+def _table_rows(item):
+    """
+    Return an element's body.json.rows list if it is the IP table, else None.
+
+    Other elements may carry tables too, so a table only counts if its
+    first row after the header has the IP table's shape (_is_table_row).
+    The same rule is applied by _stream_table_rows().
+
+    Args:
+        item (object): Element of the response's top-level "data" list.
+
+    Returns:
+        list | None: The table rows.
+    """
+    for key in ("body", "json", "rows"):
+        if not isinstance(item, dict):
+            return None
+        item = item.get(key)
+    if isinstance(item, list) and len(item) > 1 and _is_table_row(item[1]):
+        return item
+    return None
+
+
+def _find_table_rows(items):
+    """
+    Locate the IP table among the response's top-level "data" elements:
+    the first element whose table passes the shape check in _table_rows().
+    _stream_table_rows() applies the same first-match rule.
+
+    Args:
+        items (list): The response's top-level "data" list.
+
+    Returns:
+        list: The table rows, including the leading header row.
+
+    Raises:
+        ValueError: If no element contains the IP table.
+    """
+    for item in items:
+        rows = _table_rows(item)
+        if rows is not None:
+            return rows
+    raise ValueError("IP table not found in API response")
+
+
+def _stream_table_rows(stream):
+    """
+    Incrementally parse the API response and yield the rows of the IP table
+    one at a time. Only each row is materialized; the rest of the document
+    is parsed and discarded, and reading stops once the table has been seen.
+
+    Only the header and first row of other tables are built, to apply the
+    same shape check as _table_rows(); as in _find_table_rows(), the IP
+    table is the first element that passes it.
+
+    Args:
+        stream (file-like): Raw (decoded) response body.
+
+    Yields:
+        dict: One row of the IP table, including the leading header row.
+
+    Raises:
+        ValueError: If no element contains the IP table.
+    """
+    rows_prefix = "data.item.body.json.rows"
+    row_prefix = rows_prefix + ".item"
+
+    position = -1
+    found = None      # Position of the table being streamed
+    row_index = -1
+    header = None
+    builder = None
+    depth = 0
+
+    for prefix, event, value in ijson.parse(stream, use_float=True):
+        # Any opening or scalar event at "data.item" starts a new element
+        if prefix == "data.item" and event not in ("map_key", "end_map", "end_array"):
+            if found is not None:
+                break
+            position += 1
+
+        if prefix == rows_prefix and event == "start_array":
+            row_index = -1
+            header = None
+            continue
+
+        # Build the current row if it is still needed
+        if builder is not None:
+            builder.event(event, value)
+            if event in ("start_map", "start_array"):
+                depth += 1
+            elif event in ("end_map", "end_array"):
+                depth -= 1
+            if depth:
+                continue
+            row = builder.value
+            builder = None
+        elif prefix == row_prefix and event not in ("map_key", "end_map", "end_array"):
+            row_index += 1
+            # Only the header and first row are needed to recognize a table
+            if found != position and row_index > 1:
+                continue
+            if event in ("start_map", "start_array"):
+                builder = ijson.ObjectBuilder()
+                builder.event(event, value)
+                depth = 1
+                continue
+            row = value
+        else:
+            continue
+
+        if found == position:
+            yield row
+        elif row_index == 0:
+            header = row
+        elif row_index == 1 and _is_table_row(row):
+            found = position
+            yield header
+            yield row
+
+    if found is None:
+        raise ValueError("IP table not found in API response")
+
+def _is_ready(notes):
+    """
+    Determine whether an IP entry is ready, i.e. none of its notes carry the
+    "not ready" id (NOT_READY_NOTE_ID).
+
+    Args:
+        notes (iterable[dict]): The entry's notes.
+
+    Returns:
+        bool: True if the entry is ready.
+    """
+    for note in notes:
+        if note.get("id") == NOT_READY_NOTE_ID:
+            return False
+    return True
+
+
+class EgressIPTable(Sequence):
+    """
+    Column-oriented container for extracted egress IP records.
+
+    Each field is kept in its own list (one slot per IP) instead of a dict
+    per record, which is several times smaller for large feeds. Indexing or
+    iterating yields the same per-IP dicts as before, built on demand.
+    """
+
+    FIELDS = ("ip_address", "region", "location", "multivip", "ready")
+
+    def __init__(self):
+        self.ip_address = []
+        self.region = []
+        self.location = []
+        self.multivip = []
+        self.ready = []
+
+    def columns(self):
+        """
+        Returns:
+            tuple[list]: The column lists, in FIELDS order.
+        """
+        return (self.ip_address, self.region, self.location, self.multivip, self.ready)
+
+    def __len__(self):
+        return len(self.ip_address)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return dict(zip(self.FIELDS, [col[index] for col in self.columns()]))
+
+    def __iter__(self):
+        fields = self.FIELDS
+        for row in zip(*self.columns()):
+            yield dict(zip(fields, row))
+
+    def extend(self, other):
+        """
+        Append all records of another table to this one.
+
+        Args:
+            other (EgressIPTable): Table to append.
+        """
+        for col, other_col in zip(self.columns(), other.columns()):
+            col.extend(other_col)
+
+
+def fetch_if_modified(url=DEFAULT_URL, streaming=False, validators=None):
+    """
+    Fetch Zscaler egress IPs with a conditional request.
+
+    Args:
+        url (str): The API endpoint to query.
+        streaming (bool): Parse the response incrementally (see
+            fetch_zscaler_egress_ips).
+        validators (dict): Optional "etag"/"last_modified" values from a
+            previous fetch, sent as If-None-Match/If-Modified-Since.
+
+    Returns:
+        tuple[EgressIPTable | None, dict]: The extracted IPs and the
+            response's {"etag": ..., "last_modified": ...}; or
+            (None, validators) if the server reports the data has not
+            changed since `validators`.
+    """
+    if streaming and ijson is None:
+        raise RuntimeError("Streaming mode requires the 'ijson' package (pip install ijson)")
+
+    headers = {}
+    if validators:
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    print(f"[INFO] Fetching from: {url}")
+    resp = _SESSION.get(url, timeout=REQUEST_TIMEOUT, stream=streaming, headers=headers)
+    # Close the response even if parsing stops early or fails, so a streamed
+    # connection is released back to the session pool
+    with resp:
+        resp.raise_for_status()
+        if resp.status_code == 304:
+            return None, validators
+
+        # The IP data is stored in this deeply nested structure; the first row is a header
+        if streaming:
+            resp.raw.decode_content = True
+            entries = itertools.islice(_stream_table_rows(resp.raw), 1, None)
+        else:
+            data = _json_loads(resp.content)
+            entries = _find_table_rows(data.get("data", []))[1:]
+        results = EgressIPTable()
+        # Local aliases avoid repeated global/attribute lookups per entry
+        add_ip, add_region, add_location, add_multivip, add_ready = (
+            col.append for col in results.columns()
+        )
+        is_ready = _is_ready
+        intern = sys.intern
+        new_validators = {
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified")
+        }
+
+        # Iterate through all region entries and extract usable IPs
+        for region in entries:
+            for col in region.get("cols", ()):
+                for entry in col.get("data", ()):
+                    # A multivip group contributes each member; any other entry is its own member
+                    multivip = bool(entry.get("multivip"))
+                    members = entry.get("data", ()) if multivip else (entry,)
+                    for member in members:
+                        get = member.get
+                        add_ip(get("ip_address"))
+                        # Many IPs share a region/location; intern so duplicates share one string
+                        region_name = get("region")
+                        add_region(intern(region_name) if isinstance(region_name, str) else region_name)
+                        location = get("location")
+                        add_location(intern(location) if isinstance(location, str) else location)
+                        add_multivip(multivip)
+                        # Most entries have no notes; skip the helper call for those
+                        notes = get("notes")
+                        add_ready(not notes or is_ready(notes))
+
+    return results, new_validators
+
+
+def fetch_zscaler_egress_ips(url=DEFAULT_URL, streaming=False):
     """
     Fetch Zscaler egress IPs from the provided API endpoint.
 
     Args:
         url (str): The API endpoint to query.
+        streaming (bool): Parse the response incrementally with ijson instead
+            of loading the whole document (lower memory, somewhat slower).
 
     Returns:
-        list: A list of dictionaries representing IP addresses and metadata.
+        EgressIPTable: A sequence of dictionaries representing IP addresses
+            and metadata, stored column-wise.
 
     Example output (default mode):
     [
@@ -54,43 +441,180 @@ def fetch_zscaler_egress_ips(url=DEFAULT_URL):
       }
     ]
     """
-    print(f"[INFO] Fetching from: {url}")
-    resp = requests.get(url)
-    resp.raise_for_status()
-    data = resp.json()
-
-    # The IP data is stored in this deeply nested structure
-    entries = data.get("data", [])[6]["body"]["json"]["rows"][1:]
-    results = []
-
-    # Iterate through all region entries and extract usable IPs
-    for region in entries:
-        cols = region.get("cols", [])
-        for col in cols:
-            data_items = col.get("data", [])
-            for entry in data_items:
-                # If entry is a multivip group, loop through each member
-                if entry.get("multivip"):
-                    for sub in entry.get("data", []):
-                        is_ready = not any(note.get("id") == 3 for note in sub.get("notes", []))
-                        results.append({
-                            "ip_address": sub.get("ip_address"),
-                            "region": sub.get("region"),
-                            "location": sub.get("location"),
-                            "multivip": True,
-                            "ready": is_ready
-                        })
-                else:
-                    is_ready = not any(note.get("id") == 3 for note in entry.get("notes", []))
-                    results.append({
-                        "ip_address": entry.get("ip_address"),
-                        "region": entry.get("region"),
-                        "location": entry.get("location"),
-                        "multivip": False,
-                        "ready": is_ready
-                    })
-
-    return results
+    return fetch_if_modified(url, streaming=streaming)[0]
+
+def _parse_cidr(text):
+    """
+    Parse an IP address or CIDR string into integers without building
+    ipaddress objects. Host bits are cleared, as with strict=False.
+
+    Args:
+        text (str): IPv4/IPv6 address, optionally with a "/prefix" suffix.
+
+    Returns:
+        tuple[int, int, int]: (network address, prefix length, socket family).
+
+    Raises:
+        ValueError: If the text is not a valid address or CIDR.
+    """
+    addr, sep, prefix = text.partition("/")
+    if "%" in addr or (sep and not (prefix.isascii() and prefix.isdigit())):
+        # Scope ids and netmask/hostmask suffixes are rare; let ipaddress handle (or reject) them
+        net = ipaddress.ip_network(text, strict=False)
+        family = socket.AF_INET if net.version == 4 else socket.AF_INET6
+        return int(net.network_address), net.prefixlen, family
+
+    if ":" in addr:
+        family, bits = socket.AF_INET6, 128
+    else:
+        family, bits = socket.AF_INET, 32
+
+    try:
+        value = int.from_bytes(socket.inet_pton(family, addr), "big")
+    except OSError:
+        raise ValueError(f"'{addr}' does not appear to be an IPv4 or IPv6 address") from None
+
+    prefixlen = int(prefix) if sep else bits
+    if prefixlen > bits:
+        raise ValueError(f"'{prefix}' is not a valid netmask")
+
+    return value & ~((1 << (bits - prefixlen)) - 1), prefixlen, family
+
+
+def _format_cidr(addr, prefix, family):
+    """
+    Format an integer network address and prefix length as a CIDR string.
+
+    Args:
+        addr (int): Network address.
+        prefix (int): Prefix length.
+        family (int): socket.AF_INET or socket.AF_INET6.
+
+    Returns:
+        str: The block in "<address>/<prefix>" notation.
+    """
+    if family == socket.AF_INET:
+        return f"{socket.inet_ntop(family, addr.to_bytes(4, 'big'))}/{prefix}"
+    # ipaddress gives the canonical IPv6 text (inet_ntop differs for IPv4-mapped forms)
+    return f"{ipaddress.IPv6Address(addr)}/{prefix}"
+
+
+def _collapse_blocks(blocks, max_prefix):
+    """
+    Collapse CIDR blocks of a single address family into the minimal set of
+    covering blocks, using integer arithmetic only.
+
+    After sorting by (address, prefix), any block containing another comes
+    directly before it, so one pass with a stack can drop contained blocks
+    and merge sibling pairs (the two halves of the same parent block) as
+    they appear. This stays linear after the sort, unlike
+    ipaddress.collapse_addresses() on large inputs.
+
+    Args:
+        blocks (iterable[tuple[int, int]]): (network address, prefix length)
+            pairs with host bits cleared.
+        max_prefix (int): 32 for IPv4, 128 for IPv6.
+
+    Returns:
+        list[tuple[int, int]]: Collapsed blocks in ascending address order.
+    """
+    stack = []
+    for addr, prefix in sorted(blocks):
+        if stack:
+            top_addr, top_prefix = stack[-1]
+            # Already covered by the previous block
+            if addr < top_addr + (1 << (max_prefix - top_prefix)):
+                continue
+
+        # Merge with the previous block while the two are siblings
+        while stack and prefix:
+            top_addr, top_prefix = stack[-1]
+            size = 1 << (max_prefix - prefix)
+            if top_prefix != prefix or top_addr & size or top_addr + size != addr:
+                break
+            stack.pop()
+            addr, prefix = top_addr, prefix - 1
+
+        stack.append((addr, prefix))
+    return stack
+
+
+def _collapse_sorted_ipv4(addrs, prefixes, out_addrs, out_prefixes):
+    """
+    Equivalent of _collapse_blocks() for IPv4, written for numba: operates
+    on int64 arrays already sorted by (address, prefix) and writes the
+    collapsed blocks into the output arrays.
+
+    Returns:
+        int: Number of collapsed blocks written.
+    """
+    count = 0
+    for i in range(addrs.shape[0]):
+        addr = addrs[i]
+        prefix = prefixes[i]
+        if count and addr < out_addrs[count - 1] + (1 << (32 - out_prefixes[count - 1])):
+            continue
+
+        while count and prefix:
+            top_addr = out_addrs[count - 1]
+            size = 1 << (32 - prefix)
+            if out_prefixes[count - 1] != prefix or top_addr & size or top_addr + size != addr:
+                break
+            count -= 1
+            addr = top_addr
+            prefix -= 1
+
+        out_addrs[count] = addr
+        out_prefixes[count] = prefix
+        count += 1
+    return count
+
+
+def _load_ipv4_kernel():
+    """
+    Import numba/numpy and compile the IPv4 collapse kernel on first use.
+
+    Returns:
+        tuple | bool: (numpy module, compiled kernel), or False if numba or
+            numpy is not installed.
+    """
+    global _ipv4_kernel
+    if _ipv4_kernel is None:
+        try:
+            import numba
+            import numpy
+        except ImportError:
+            # numba/numpy are optional; only used to speed up very large summaries
+            _ipv4_kernel = False
+        else:
+            _ipv4_kernel = (numpy, numba.njit(cache=True)(_collapse_sorted_ipv4))
+    return _ipv4_kernel
+
+
+def _collapse_ipv4_blocks(blocks):
+    """
+    Collapse IPv4 (address, prefix) blocks, using the numba kernel for
+    large inputs when numba is installed. IPv6 values do not fit in 64-bit
+    integers, so IPv6 always uses the pure Python sweep.
+
+    Args:
+        blocks (list[tuple[int, int]]): (network address, prefix length) pairs.
+
+    Returns:
+        list[tuple[int, int]]: Collapsed blocks in ascending address order.
+    """
+    kernel = _load_ipv4_kernel() if len(blocks) >= NUMBA_MIN_BLOCKS else False
+    if not kernel:
+        return _collapse_blocks(blocks, 32)
+
+    np, collapse = kernel
+    array = np.array(blocks, dtype=np.int64)
+    order = np.lexsort((array[:, 1], array[:, 0]))
+    addrs, prefixes = array[order, 0], array[order, 1]
+    out_addrs, out_prefixes = np.empty_like(addrs), np.empty_like(prefixes)
+    count = collapse(addrs, prefixes, out_addrs, out_prefixes)
+    return list(zip(out_addrs[:count].tolist(), out_prefixes[:count].tolist()))
+
 
 def summarize_ip_blocks(ip_entries):
     """
@@ -98,12 +622,13 @@ def summarize_ip_blocks(ip_entries):
     IPv4 and IPv6 are summarized separately and combined in the output.
 
     Args:
-        ip_entries (list[dict]): Each item should contain:
+        ip_entries (EgressIPTable | list[dict]): Each item should contain:
             - 'ip_address' (str): IP or CIDR
             - 'ready' (bool): only True entries are summarized
 
     Returns:
-        list[dict]: [{"ip_address": "<cidr>"} ...]
+        iterator[dict]: [{"ip_address": "<cidr>"} ...], generated lazily
+            (wrap in list() if a list is needed).
 
     Example output (--summarize mode):
     [
@@ -113,51 +638,180 @@ def summarize_ip_blocks(ip_entries):
     ]
     """
     ipv4, ipv6 = [], []
+    # Local aliases avoid repeated global/attribute lookups per entry
+    parse_cidr = _parse_cidr
+    add_v4, add_v6 = ipv4.append, ipv6.append
+    af_inet = socket.AF_INET
+
+    # Read the needed columns directly when given a table to skip building dicts
+    if isinstance(ip_entries, EgressIPTable):
+        pairs = zip(ip_entries.ip_address, ip_entries.ready)
+    else:
+        pairs = ((item.get("ip_address"), item.get("ready", False)) for item in ip_entries)
 
-    for item in ip_entries:
+    for raw, ready in pairs:
         # Only include entries explicitly marked ready=True
-        if not item.get("ready", False):
+        if not ready:
             continue
 
-        raw = item.get("ip_address")
         if not raw:
             continue
 
         try:
-            net = ipaddress.ip_network(raw.strip(), strict=False)
-            if isinstance(net, ipaddress.IPv4Network):
-                ipv4.append(net)
-            else:
-                ipv6.append(net)
+            addr, prefix, family = parse_cidr(raw.strip())
         except ValueError as ve:
             print(f"[WARN] Skipping invalid IP '{raw}': {ve}")
+            continue
+
+        if family == af_inet:
+            add_v4((addr, prefix))
+        else:
+            add_v6((addr, prefix))
 
     # Collapse separately to avoid mixed-version errors
-    collapsed_v4 = list(ipaddress.collapse_addresses(ipv4))
-    collapsed_v6 = list(ipaddress.collapse_addresses(ipv6))
+    collapsed = itertools.chain(
+        ((block, socket.AF_INET) for block in _collapse_ipv4_blocks(ipv4)),
+        ((block, socket.AF_INET6) for block in _collapse_blocks(ipv6, 128))
+    )
+
+    # Format lazily so the writer can consume blocks without an intermediate list
+    return ({"ip_address": _format_cidr(addr, prefix, family)} for (addr, prefix), family in collapsed)
 
-    # Merge results and format as required
-    collapsed = collapsed_v4 + collapsed_v6
-    return [{"ip_address": str(cidr)} for cidr in collapsed]
-    
 def save_as_json(data, filename="zscaler_egress_ips.json"):
     """
     Save the extracted IP data into a JSON file.
 
+    Entries are encoded and written one at a time, so the full document is
+    never held in memory; the output matches a single indent=2 dump. The
+    file is written under a temporary name and renamed into place, so a
+    failed write never leaves a truncated file at `filename`.
+
     Args:
-        data (list): List of IPs or IP blocks.
+        data (iterable[dict]): IPs or IP blocks (list, EgressIPTable or generator).
         filename (str): Path to output JSON file.
     """
-    with open(filename, "w") as f:
-        json.dump(data, f, indent=2)
-    print(f"[INFO] Saved {len(data)} entries to {filename}")
+    count = 0
+    tmp_filename = filename + ".tmp"
+    try:
+        with open(tmp_filename, "wb", buffering=1 << 20) as f:
+            f.write(b"[")
+            separator = b"\n  "
+            for entry in data:
+                f.write(separator)
+                # Nest the entry's own indentation one level inside the array
+                f.write(_json_dumps(entry).replace(b"\n", b"\n  "))
+                separator = b",\n  "
+                count += 1
+            f.write(b"\n]" if count else b"]")
+        os.replace(tmp_filename, filename)
+    except BaseException:
+        try:
+            os.remove(tmp_filename)
+        except FileNotFoundError:
+            pass
+        raise
+    print(f"[INFO] Saved {count} entries to {filename}")
 
-if __name__ == "__main__":
+def fetch_egress_ips_from_urls(urls, streaming=False):
+    """
+    Fetch egress IPs from several API endpoints concurrently and combine
+    them into one table. Requests share the pooled session, so total time
+    is roughly that of the slowest endpoint rather than the sum.
+
+    Args:
+        urls (list[str]): The API endpoints to query.
+        streaming (bool): Parse each response incrementally (see
+            fetch_zscaler_egress_ips).
+
+    Returns:
+        EgressIPTable: Records from all endpoints, in the order of `urls`.
+    """
+    fetch = functools.partial(fetch_zscaler_egress_ips, streaming=streaming)
+    with ThreadPoolExecutor(max_workers=min(len(urls), POOL_MAXSIZE)) as executor:
+        tables = list(executor.map(fetch, urls))
+
+    combined = EgressIPTable()
+    for table in tables:
+        combined.extend(table)
+    return combined
+
+
+def load_cache_validators(filename, url, summarize):
+    """
+    Load HTTP cache validators saved alongside a previous output file.
+
+    Validators are only returned if the output file still exists and was
+    produced from the same URL in the same mode, so a 304 response means the
+    existing file can be kept as-is.
+
+    Args:
+        filename (str): Path to the output JSON file.
+        url (str): The API endpoint being queried.
+        summarize (bool): Whether summarized output is being produced.
+
+    Returns:
+        dict | None: {"etag": ..., "last_modified": ...} or None.
+    """
+    try:
+        with open(filename + ".etag", "rb") as f:
+            cached = _json_loads(f.read())
+    except (OSError, ValueError):
+        return None
+
+    if not os.path.exists(filename) or cached.get("url") != url or cached.get("summarize") != summarize:
+        return None
+    return {"etag": cached.get("etag"), "last_modified": cached.get("last_modified")}
+
+
+def clear_cache_validators(filename):
+    """
+    Remove the cache validator sidecar of an output file, if any. Called
+    before the output is rewritten so a stale sidecar can never vouch for
+    different (or partially written) contents.
+
+    Args:
+        filename (str): Path to the output JSON file.
+    """
+    try:
+        os.remove(filename + ".etag")
+    except FileNotFoundError:
+        pass
+
+
+def save_cache_validators(filename, url, summarize, validators):
+    """
+    Save HTTP cache validators in a sidecar file next to the output file.
+    Nothing is written if the server sent no validators.
+
+    Args:
+        filename (str): Path to the output JSON file.
+        url (str): The API endpoint that was queried.
+        summarize (bool): Whether summarized output was produced.
+        validators (dict): {"etag": ..., "last_modified": ...}
+    """
+    if not any(validators.values()):
+        return
+    with open(filename + ".etag", "wb") as f:
+        f.write(_json_dumps({"url": url, "summarize": summarize, **validators}))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_parser():
+    """
+    Build the command-line parser once and reuse it for later main() calls.
+
+    Returns:
+        argparse.ArgumentParser: The CLI argument parser.
+    """
     parser = argparse.ArgumentParser(description="Fetch Zscaler egress IPs and save to JSON.")
     parser.add_argument(
         "--url",
-        help=f"Override the default Zscaler JSON URL (default: {DEFAULT_URL})",
-        default=DEFAULT_URL
+        help=(
+            f"Override the default Zscaler JSON URL (default: {DEFAULT_URL}). "
+            "May be given several URLs or repeated; they are fetched concurrently and combined"
+        ),
+        nargs="+",
+        action="extend"
     )
     parser.add_argument(
         "--output",
@@ -169,16 +823,61 @@ if __name__ == "__main__":
         help="Output summarized CIDR blocks instead of full metadata",
         action="store_true"
     )
-    args = parser.parse_args()
+    parser.add_argument(
+        "--streaming",
+        help="Parse the API response incrementally to reduce memory use (requires ijson)",
+        action="store_true"
+    )
+    parser.add_argument(
+        "--no-cache",
+        help="Always download the full data, ignoring the saved ETag/Last-Modified",
+        action="store_true"
+    )
+    return parser
+
+
+def main(argv=None):
+    """
+    Command-line entry point.
+
+    Args:
+        argv (list[str]): Arguments to parse (default: sys.argv[1:]).
+    """
+    args = _get_parser().parse_args(argv)
+
+    urls = args.url or [DEFAULT_URL]
 
     try:
-        full_ips = fetch_zscaler_egress_ips(url=args.url)
-        if args.summarize:
-            summarized = summarize_ip_blocks(full_ips)
-            save_as_json(summarized, filename=args.output)
+        if len(urls) == 1:
+            validators = None
+            if not args.no_cache:
+                validators = load_cache_validators(args.output, urls[0], args.summarize)
+
+            full_ips, validators = fetch_if_modified(
+                url=urls[0], streaming=args.streaming, validators=validators
+            )
+        else:
+            # Conditional requests only apply to a single endpoint: a 304 from one of
+            # several would still require the others' data to rebuild the output
+            full_ips = fetch_egress_ips_from_urls(urls, streaming=args.streaming)
+            validators = {}
+
+        if full_ips is None:
+            print(f"[INFO] Data not modified since last run; keeping {args.output}")
         else:
-            save_as_json(full_ips, filename=args.output)
+            # Drop the old sidecar first; a new one is only saved once the output is in place
+            clear_cache_validators(args.output)
+            if args.summarize:
+                summarized = summarize_ip_blocks(full_ips)
+                save_as_json(summarized, filename=args.output)
+            else:
+                save_as_json(full_ips, filename=args.output)
+            save_cache_validators(args.output, urls[0], args.summarize, validators)
     except requests.exceptions.RequestException as e:
         print(f"[ERROR] Failed to fetch data: {e}")
     except Exception as e:
         print(f"[ERROR] Unexpected error: {e}")
+
+
+if __name__ == "__main__":
+    main()